@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
+# Standard library only, so this also runs under PyPy: pypy3 analyze_ms.py
 
 import csv
 import os
+import sys
 from collections import defaultdict
 
+from results_cache import load_cached
+
 # Read the results
 results_file = "experiment_results/results_ms.csv"
 
@@ -11,16 +15,126 @@ if not os.path.exists(results_file):
     print(f"Results file {results_file} not found. Run run_experiments_ms.sh first.")
     exit(1)
 
-# Parse CSV data
-data = []
-with open(results_file, 'r') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        row['Time_ms'] = int(row['Time_ms'])
-        row['M'] = int(row['M'])
-        row['R'] = int(row['R'])
-        row['Edges'] = int(row['Edges'])
-        data.append(row)
+SIZES = ['tiny', 'small', 'medium', 'large', 'xlarge']
+
+# Table row formats, built once instead of re-parsing an f-string spec per row
+SIZE_ROW = "{:<10} {:<10} {:<15.1f} {:<15.1f} {:+.1f}%{:<9} {:<10}".format
+MAPPER_ROW = "{:<5} {:<15.1f} {:<15.1f} {:<15.2f} {:<15.2f}".format
+REDUCER_ROW = "{:<5} {:<15.1f} {:<15.1f} {:+.1f}%{:<14} {:+.1f}%".format
+WORKER_ROW = "{:<10} {:<15.1f} {:<15.1f} {:<14.1f}% {:<14.1f}%".format
+CONFIG_ROWS = ("  {}:\n"
+               "    Best:  M={:2d}, R={:2d} -> {:6d} ms\n"
+               "    Worst: M={:2d}, R={:2d} -> {:6d} ms\n"
+               "    Range: {} ms ({:.1f}% slower)").format
+
+def new_stats():
+    """
+    Return an empty running-statistics slot: [count, sum, mean, M2, min, max].
+    """
+    return [0, 0, 0.0, 0.0, float('inf'), float('-inf')]
+
+def add_sample(stats, x):
+    """
+    Fold one time into a running-statistics slot using Welford's update,
+    so mean and variance need a single pass and no stored samples. The exact
+    sum is kept alongside so reported means match sum/count to the last digit.
+    """
+    stats[0] += 1
+    stats[1] += x
+    delta = x - stats[2]
+    stats[2] += delta / stats[0]
+    stats[3] += delta * (x - stats[2])
+    if x < stats[4]:
+        stats[4] = x
+    if x > stats[5]:
+        stats[5] = x
+
+def merge_stats(into, other):
+    """
+    Fold one running-statistics slot into another (Chan et al.'s pairwise
+    form of Welford's update), so slots roll up without revisiting rows.
+    """
+    n = into[0] + other[0]
+    if n == 0:
+        return
+    delta = other[2] - into[2]
+    into[3] += other[3] + delta * delta * into[0] * other[0] / n
+    into[2] += delta * other[0] / n
+    into[0] = n
+    into[1] += other[1]
+    into[4] = min(into[4], other[4])
+    into[5] = max(into[5], other[5])
+
+def write_table(lines):
+    """
+    Write a section's collected lines with a single stdout write.
+    """
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+def mean(stats):
+    """
+    Return the exact mean (sum/count) of a running-statistics slot.
+    """
+    return stats[1] / stats[0]
+
+def std(stats):
+    """
+    Return the population standard deviation of a running-statistics slot.
+    """
+    return (stats[3] / stats[0]) ** 0.5
+
+def rollup(select, bucket):
+    """
+    Merge the per-configuration slots whose (size, program, M, R) key passes
+    select into one slot per bucket(size, program, M, R).
+    """
+    out = defaultdict(new_stats)
+    for key, stats in config_stats.items():
+        if select(*key):
+            merge_stats(out[bucket(*key)], stats)
+    return out
+
+def reduce_results(path):
+    """
+    Parse the results CSV in a single pass, reducing every row straight into
+    the running statistics of its (Input_Size, Program, M, R) configuration.
+    Every section below is derived from these slots without rescanning rows.
+    Returns (config_stats, edges_by_size).
+    """
+    config_stats = defaultdict(new_stats)
+    edges_by_size = {}
+    with open(path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        raw = list(zip(*reader)) or [()] * len(header)
+    # Cast whole columns with map() rather than calling int() field by field
+    columns = {name: raw[header.index(name)] for name in ['Input_Size', 'Program']}
+    for name in ['M', 'R', 'Edges', 'Time_ms']:
+        columns[name] = map(int, raw[header.index(name)])
+    for size, prog, m, r, edges, t in zip(*columns.values()):
+        add_sample(config_stats[(size, prog, m, r)], t)
+        if size not in edges_by_size:
+            edges_by_size[size] = edges
+    return dict(config_stats), edges_by_size
+
+# Repeat runs on an unchanged CSV reuse the reduced statistics from disk
+config_stats, edges_by_size = load_cached(results_file, reduce_results)
+
+size_stats = rollup(lambda size, prog, m, r: True, lambda size, prog, m, r: (size, prog))
+
+# Fastest and slowest configuration per (Input_Size, Program) for section 3,
+# tracked in one scan as [best_m, best_r, best_ms, worst_m, worst_r, worst_ms]
+extremes = {}
+for (size, prog, m, r), stats in config_stats.items():
+    ext = extremes.get((size, prog))
+    if ext is None:
+        extremes[(size, prog)] = [m, r, stats[4], m, r, stats[5]]
+        continue
+    if stats[4] < ext[2]:
+        ext[0:3] = m, r, stats[4]
+    if stats[5] > ext[5]:
+        ext[3:6] = m, r, stats[5]
 
 print("=" * 80)
 print("PERFORMANCE EXPERIMENT RESULTS ANALYSIS (Millisecond Precision)")
@@ -30,17 +144,16 @@ print("=" * 80)
 print("\n1. OVERALL COMPARISON: Multi-Process (findsp) vs Multi-Threaded (findst)")
 print("-" * 70)
 
-process_times = [d['Time_ms'] for d in data if d['Program'] == 'findsp']
-thread_times = [d['Time_ms'] for d in data if d['Program'] == 'findst']
+program_stats = rollup(lambda size, prog, m, r: True, lambda size, prog, m, r: prog)
 
-if process_times and thread_times:
+if 'findsp' in program_stats and 'findst' in program_stats:
+    avg_sp = mean(program_stats['findsp'])
+    avg_st = mean(program_stats['findst'])
     print(f"Average execution time:")
-    print(f"  - findsp (processes): {sum(process_times)/len(process_times):.1f} ms")
-    print(f"  - findst (threads):   {sum(thread_times)/len(thread_times):.1f} ms")
+    print(f"  - findsp (processes): {avg_sp:.1f} ms")
+    print(f"  - findst (threads):   {avg_st:.1f} ms")
     
     # Performance difference
-    avg_sp = sum(process_times)/len(process_times)
-    avg_st = sum(thread_times)/len(thread_times)
     diff = ((avg_st - avg_sp) / avg_sp * 100) if avg_sp > 0 else 0
     print(f"  - Difference: {diff:+.1f}% (positive means threads are slower)")
 
@@ -48,158 +161,122 @@ if process_times and thread_times:
 print("\n2. PERFORMANCE BY INPUT SIZE (times in milliseconds)")
 print("-" * 70)
 
-size_stats = defaultdict(lambda: {'findsp': [], 'findst': []})
-for d in data:
-    size_stats[d['Input_Size']][d['Program']].append(d['Time_ms'])
-
 print(f"{'Size':<10} {'Edges':<10} {'findsp (ms)':<15} {'findst (ms)':<15} {'Difference':<15} {'Winner':<10}")
 print("-" * 80)
-for size in ['tiny', 'small', 'medium', 'large', 'xlarge']:
-    if size in size_stats:
-        edges = next((d['Edges'] for d in data if d['Input_Size'] == size), 0)
-        sp_times = size_stats[size]['findsp']
-        st_times = size_stats[size]['findst']
-        if sp_times and st_times:
-            sp_avg = sum(sp_times) / len(sp_times)
-            st_avg = sum(st_times) / len(st_times)
-            diff = ((st_avg - sp_avg) / sp_avg * 100) if sp_avg > 0 else 0
-            winner = "Process" if sp_avg < st_avg else "Thread" if st_avg < sp_avg else "Tie"
-            print(f"{size:<10} {edges:<10} {sp_avg:<15.1f} {st_avg:<15.1f} {diff:+.1f}%{'':<9} {winner:<10}")
+lines = []
+for size in SIZES:
+    if (size, 'findsp') in size_stats and (size, 'findst') in size_stats:
+        edges = edges_by_size[size]
+        sp_avg = mean(size_stats[(size, 'findsp')])
+        st_avg = mean(size_stats[(size, 'findst')])
+        diff = ((st_avg - sp_avg) / sp_avg * 100) if sp_avg > 0 else 0
+        winner = "Process" if sp_avg < st_avg else "Thread" if st_avg < sp_avg else "Tie"
+        lines.append(SIZE_ROW(size, edges, sp_avg, st_avg, diff, '', winner))
+write_table(lines)
 
 # 3. Best and worst configurations for each input size
 print("\n3. BEST AND WORST CONFIGURATIONS BY INPUT SIZE")
 print("-" * 70)
 
-for size in ['tiny', 'small', 'medium', 'large', 'xlarge']:
-    size_data = [d for d in data if d['Input_Size'] == size]
-    if size_data:
-        sp_data = [d for d in size_data if d['Program'] == 'findsp']
-        st_data = [d for d in size_data if d['Program'] == 'findst']
-        
-        if sp_data and st_data:
-            best_sp = min(sp_data, key=lambda x: x['Time_ms'])
-            worst_sp = max(sp_data, key=lambda x: x['Time_ms'])
-            best_st = min(st_data, key=lambda x: x['Time_ms'])
-            worst_st = max(st_data, key=lambda x: x['Time_ms'])
-            
-            print(f"\n{size.upper()} ({best_sp['Edges']:,} edges):")
-            print(f"  findsp:")
-            print(f"    Best:  M={best_sp['M']:2d}, R={best_sp['R']:2d} -> {best_sp['Time_ms']:6d} ms")
-            print(f"    Worst: M={worst_sp['M']:2d}, R={worst_sp['R']:2d} -> {worst_sp['Time_ms']:6d} ms")
-            print(f"    Range: {worst_sp['Time_ms'] - best_sp['Time_ms']} ms ({(worst_sp['Time_ms']/best_sp['Time_ms'] - 1)*100:.1f}% slower)")
-            
-            print(f"  findst:")
-            print(f"    Best:  M={best_st['M']:2d}, R={best_st['R']:2d} -> {best_st['Time_ms']:6d} ms")
-            print(f"    Worst: M={worst_st['M']:2d}, R={worst_st['R']:2d} -> {worst_st['Time_ms']:6d} ms")
-            print(f"    Range: {worst_st['Time_ms'] - best_st['Time_ms']} ms ({(worst_st['Time_ms']/best_st['Time_ms'] - 1)*100:.1f}% slower)")
+lines = []
+for size in SIZES:
+    if (size, 'findsp') in size_stats and (size, 'findst') in size_stats:
+        lines.append(f"\n{size.upper()} ({edges_by_size[size]:,} edges):")
+        for prog in ['findsp', 'findst']:
+            best_m, best_r, best_ms, worst_m, worst_r, worst_ms = extremes[(size, prog)]
+
+            lines.append(CONFIG_ROWS(prog, best_m, best_r, best_ms, worst_m, worst_r, worst_ms,
+                                     worst_ms - best_ms, (worst_ms/best_ms - 1)*100))
+write_table(lines)
 
 # 4. Effect of varying M (mappers) - for large dataset
 print("\n4. EFFECT OF NUMBER OF MAPPERS (M) - Large dataset, Fixed R=2")
 print("-" * 70)
 
-large_r2 = [d for d in data if d['Input_Size'] == 'large' and d['R'] == 2]
-if large_r2:
-    m_stats = defaultdict(lambda: {'findsp': [], 'findst': []})
-    for d in large_r2:
-        m_stats[d['M']][d['Program']].append(d['Time_ms'])
-
+m_stats = rollup(lambda size, prog, m, r: size == 'large' and r == 2,
+                 lambda size, prog, m, r: (m, prog))
+if m_stats:
     print(f"{'M':<5} {'findsp (ms)':<15} {'findst (ms)':<15} {'Speedup (sp)':<15} {'Speedup (st)':<15}")
     print("-" * 65)
 
     # Get baseline (M=1)
-    baseline_sp = sum(m_stats[1]['findsp']) / len(m_stats[1]['findsp']) if 1 in m_stats and m_stats[1]['findsp'] else 1
-    baseline_st = sum(m_stats[1]['findst']) / len(m_stats[1]['findst']) if 1 in m_stats and m_stats[1]['findst'] else 1
+    baseline_sp = mean(m_stats[(1, 'findsp')]) if (1, 'findsp') in m_stats else 1
+    baseline_st = mean(m_stats[(1, 'findst')]) if (1, 'findst') in m_stats else 1
 
-    for m in sorted(m_stats.keys()):
-        if m_stats[m]['findsp'] and m_stats[m]['findst']:
-            sp_avg = sum(m_stats[m]['findsp']) / len(m_stats[m]['findsp'])
-            st_avg = sum(m_stats[m]['findst']) / len(m_stats[m]['findst'])
+    lines = []
+    for m in sorted({m for m, _ in m_stats}):
+        if (m, 'findsp') in m_stats and (m, 'findst') in m_stats:
+            sp_avg = mean(m_stats[(m, 'findsp')])
+            st_avg = mean(m_stats[(m, 'findst')])
             sp_speedup = baseline_sp / sp_avg if sp_avg > 0 else 0
             st_speedup = baseline_st / st_avg if st_avg > 0 else 0
-            print(f"{m:<5} {sp_avg:<15.1f} {st_avg:<15.1f} {sp_speedup:<15.2f} {st_speedup:<15.2f}")
+            lines.append(MAPPER_ROW(m, sp_avg, st_avg, sp_speedup, st_speedup))
+    write_table(lines)
 
 # 5. Effect of varying R (reducers) - for large dataset
 print("\n5. EFFECT OF NUMBER OF REDUCERS (R) - Large dataset, Fixed M=4")
 print("-" * 70)
 
-large_m4 = [d for d in data if d['Input_Size'] == 'large' and d['M'] == 4]
-if large_m4:
-    r_stats = defaultdict(lambda: {'findsp': [], 'findst': []})
-    for d in large_m4:
-        r_stats[d['R']][d['Program']].append(d['Time_ms'])
-
+r_stats = rollup(lambda size, prog, m, r: size == 'large' and m == 4,
+                 lambda size, prog, m, r: (r, prog))
+if r_stats:
     print(f"{'R':<5} {'findsp (ms)':<15} {'findst (ms)':<15} {'Overhead vs R=1':<20} {'Overhead vs R=1':<20}")
     print("-" * 75)
 
     # Get baseline (R=1)
-    baseline_sp = sum(r_stats[1]['findsp']) / len(r_stats[1]['findsp']) if 1 in r_stats and r_stats[1]['findsp'] else 1
-    baseline_st = sum(r_stats[1]['findst']) / len(r_stats[1]['findst']) if 1 in r_stats and r_stats[1]['findst'] else 1
+    baseline_sp = mean(r_stats[(1, 'findsp')]) if (1, 'findsp') in r_stats else 1
+    baseline_st = mean(r_stats[(1, 'findst')]) if (1, 'findst') in r_stats else 1
 
-    for r in sorted(r_stats.keys()):
-        if r_stats[r]['findsp'] and r_stats[r]['findst']:
-            sp_avg = sum(r_stats[r]['findsp']) / len(r_stats[r]['findsp'])
-            st_avg = sum(r_stats[r]['findst']) / len(r_stats[r]['findst'])
+    lines = []
+    for r in sorted({r for r, _ in r_stats}):
+        if (r, 'findsp') in r_stats and (r, 'findst') in r_stats:
+            sp_avg = mean(r_stats[(r, 'findsp')])
+            st_avg = mean(r_stats[(r, 'findst')])
             sp_overhead = ((sp_avg - baseline_sp) / baseline_sp * 100) if baseline_sp > 0 else 0
             st_overhead = ((st_avg - baseline_st) / baseline_st * 100) if baseline_st > 0 else 0
-            print(f"{r:<5} {sp_avg:<15.1f} {st_avg:<15.1f} {sp_overhead:+.1f}%{'':<14} {st_overhead:+.1f}%")
+            lines.append(REDUCER_ROW(r, sp_avg, st_avg, sp_overhead, '', st_overhead))
+    write_table(lines)
 
 # 6. Scalability Analysis with actual millisecond times
 print("\n6. SCALABILITY ANALYSIS - XLarge dataset (500,000 edges)")
 print("-" * 70)
 
-xlarge_data = [d for d in data if d['Input_Size'] == 'xlarge']
-if xlarge_data:
-    worker_stats = defaultdict(lambda: {'findsp': [], 'findst': []})
-    for d in xlarge_data:
-        total_workers = d['M'] + d['R']
-        worker_stats[total_workers][d['Program']].append(d['Time_ms'])
-
+worker_stats = rollup(lambda size, prog, m, r: size == 'xlarge',
+                      lambda size, prog, m, r: (m + r, prog))
+if worker_stats:
     print(f"{'Workers':<10} {'findsp (ms)':<15} {'findst (ms)':<15} {'Process Eff':<15} {'Thread Eff':<15}")
     print("-" * 70)
 
     # Get baseline (2 workers - M=1, R=1)
-    baseline_data = [d for d in xlarge_data if d['M'] == 1 and d['R'] == 1]
-    if baseline_data:
-        sp_baseline_times = [d['Time_ms'] for d in baseline_data if d['Program'] == 'findsp']
-        st_baseline_times = [d['Time_ms'] for d in baseline_data if d['Program'] == 'findst']
-        
-        if sp_baseline_times and st_baseline_times:
-            baseline_sp = sum(sp_baseline_times) / len(sp_baseline_times)
-            baseline_st = sum(st_baseline_times) / len(st_baseline_times)
-
-            for workers in sorted(worker_stats.keys()):
-                sp_times = worker_stats[workers]['findsp']
-                st_times = worker_stats[workers]['findst']
-                if sp_times and st_times:
-                    sp_avg = sum(sp_times) / len(sp_times)
-                    st_avg = sum(st_times) / len(st_times)
-                    sp_speedup = baseline_sp / sp_avg if sp_avg > 0 else 0
-                    st_speedup = baseline_st / st_avg if st_avg > 0 else 0
-                    sp_efficiency = (sp_speedup / workers * 100) if workers > 0 else 0
-                    st_efficiency = (st_speedup / workers * 100) if workers > 0 else 0
-                    print(f"{workers:<10} {sp_avg:<15.1f} {st_avg:<15.1f} {sp_efficiency:<14.1f}% {st_efficiency:<14.1f}%")
+    sp_baseline = config_stats.get(('xlarge', 'findsp', 1, 1))
+    st_baseline = config_stats.get(('xlarge', 'findst', 1, 1))
+    if sp_baseline and st_baseline:
+        baseline_sp = mean(sp_baseline)
+        baseline_st = mean(st_baseline)
+
+        lines = []
+        for workers in sorted({w for w, _ in worker_stats}):
+            if (workers, 'findsp') in worker_stats and (workers, 'findst') in worker_stats:
+                sp_avg = mean(worker_stats[(workers, 'findsp')])
+                st_avg = mean(worker_stats[(workers, 'findst')])
+                sp_speedup = baseline_sp / sp_avg if sp_avg > 0 else 0
+                st_speedup = baseline_st / st_avg if st_avg > 0 else 0
+                sp_efficiency = (sp_speedup / workers * 100) if workers > 0 else 0
+                st_efficiency = (st_speedup / workers * 100) if workers > 0 else 0
+                lines.append(WORKER_ROW(workers, sp_avg, st_avg, sp_efficiency, st_efficiency))
+        write_table(lines)
 
 # 7. Statistical summary
 print("\n7. STATISTICAL SUMMARY")
 print("-" * 70)
 
-for size in ['tiny', 'small', 'medium', 'large', 'xlarge']:
-    size_data = [d for d in data if d['Input_Size'] == size]
-    if size_data:
-        sp_times = [d['Time_ms'] for d in size_data if d['Program'] == 'findsp']
-        st_times = [d['Time_ms'] for d in size_data if d['Program'] == 'findst']
-        
-        if sp_times and st_times:
-            # Calculate variance
-            sp_mean = sum(sp_times) / len(sp_times)
-            st_mean = sum(st_times) / len(st_times)
-            sp_variance = sum((x - sp_mean) ** 2 for x in sp_times) / len(sp_times)
-            st_variance = sum((x - st_mean) ** 2 for x in st_times) / len(st_times)
-            sp_std = sp_variance ** 0.5
-            st_std = st_variance ** 0.5
-            
-            print(f"\n{size.upper()}:")
-            print(f"  findsp: mean={sp_mean:.1f}ms, std={sp_std:.1f}ms, min={min(sp_times)}ms, max={max(sp_times)}ms")
-            print(f"  findst: mean={st_mean:.1f}ms, std={st_std:.1f}ms, min={min(st_times)}ms, max={max(st_times)}ms")
+for size in SIZES:
+    if (size, 'findsp') in size_stats and (size, 'findst') in size_stats:
+        sp = size_stats[(size, 'findsp')]
+        st = size_stats[(size, 'findst')]
+
+        print(f"\n{size.upper()}:")
+        print(f"  findsp: mean={mean(sp):.1f}ms, std={std(sp):.1f}ms, min={sp[4]}ms, max={sp[5]}ms")
+        print(f"  findst: mean={mean(st):.1f}ms, std={std(st):.1f}ms, min={st[4]}ms, max={st[5]}ms")
 
 print("\n" + "=" * 80)
\ No newline at end of file
@@ -1,9 +1,7 @@
 #!/usr/bin/env python3
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
 import os
+import sys
 
 # Read the results
 results_file = "experiment_results/results.csv"
@@ -12,7 +10,29 @@ if not os.path.exists(results_file):
     print(f"Results file {results_file} not found. Run run_experiments.sh first.")
     exit(1)
 
-df = pd.read_csv(results_file)
+# Heavy imports are deferred until there is something to analyze
+interactive = '--interactive' in sys.argv[1:]
+import pandas as pd
+import matplotlib
+if not interactive:
+    matplotlib.use('Agg')  # Headless: plots are only written to disk
+import matplotlib.pyplot as plt
+import numpy as np
+
+# Parse with explicit dtypes instead of inferring them, reading the key columns
+# straight into categoricals so every groupby below works on integer codes,
+# with sizes already in plotting order
+size_order = ['tiny', 'small', 'medium', 'large']
+df = pd.read_csv(results_file, dtype={
+    'Input_Size': pd.CategoricalDtype(size_order, ordered=True),
+    'Program': 'category',
+    'Edges': 'int32',
+    'M': 'int8',
+    'R': 'int8',
+    'Time': 'float64',
+})
+df['Input_Size'] = df['Input_Size'].cat.remove_unused_categories()
+available_sizes = list(df['Input_Size'].cat.categories)
 
 # Create output directory for plots
 os.makedirs("experiment_results/plots", exist_ok=True)
@@ -21,10 +41,6 @@ os.makedirs("experiment_results/plots", exist_ok=True)
 fig, axes = plt.subplots(2, 2, figsize=(12, 10))
 fig.suptitle('Multi-Process (findsp) vs Multi-Threaded (findst) Performance')
 
-# Group by input size and program type
-size_order = ['tiny', 'small', 'medium', 'large']
-available_sizes = [s for s in size_order if s in df['Input_Size'].unique()]
-
 # Plot 1: Time vs Input Size for fixed M and R
 ax = axes[0, 0]
 fixed_m = 4
@@ -32,8 +48,9 @@ fixed_r = 4
 subset = df[(df['M'] == fixed_m) & (df['R'] == fixed_r)]
 for prog in ['findsp', 'findst']:
     prog_data = subset[subset['Program'] == prog]
-    prog_data = prog_data.set_index('Input_Size').reindex(available_sizes)
-    ax.plot(range(len(available_sizes)), prog_data['Time'], 
+    # observed=False keeps one point per available size, NaN where this M/R was not run
+    time_by_size = prog_data.groupby('Input_Size', observed=False)['Time'].mean()
+    ax.plot(range(len(available_sizes)), time_by_size, 
             marker='o', label=prog, linewidth=2)
 ax.set_xticks(range(len(available_sizes)))
 ax.set_xticklabels(available_sizes)
@@ -49,7 +66,7 @@ fixed_r = 4
 subset = df[df['R'] == fixed_r]
 for size in available_sizes[:3]:  # Use first 3 sizes for clarity
     size_data = subset[subset['Input_Size'] == size]
-    avg_by_m = size_data.groupby(['M', 'Program'])['Time'].mean().unstack()
+    avg_by_m = size_data.groupby(['M', 'Program'], observed=True)['Time'].mean().unstack()
     if 'findsp' in avg_by_m.columns:
         ax.plot(avg_by_m.index, avg_by_m['findsp'], 
                 marker='o', label=f'{size} (process)', linestyle='-')
@@ -68,7 +85,7 @@ fixed_m = 4
 subset = df[df['M'] == fixed_m]
 for size in available_sizes[:3]:  # Use first 3 sizes for clarity
     size_data = subset[subset['Input_Size'] == size]
-    avg_by_r = size_data.groupby(['R', 'Program'])['Time'].mean().unstack()
+    avg_by_r = size_data.groupby(['R', 'Program'], observed=True)['Time'].mean().unstack()
     if 'findsp' in avg_by_r.columns:
         ax.plot(avg_by_r.index, avg_by_r['findsp'], 
                 marker='o', label=f'{size} (process)', linestyle='-')
@@ -93,12 +110,9 @@ for size in available_sizes[:3]:
         baseline_time = baseline[baseline['Program'] == prog]['Time'].mean()
         
         if baseline_time > 0:
-            speedups = []
-            total_workers = []
-            for _, row in prog_data.iterrows():
-                speedup = baseline_time / row['Time'] if row['Time'] > 0 else 0
-                speedups.append(speedup)
-                total_workers.append(row['M'] + row['R'])
+            times = prog_data['Time'].to_numpy(dtype=float)
+            speedups = np.divide(baseline_time, times, out=np.zeros_like(times), where=times > 0)
+            total_workers = (prog_data['M'] + prog_data['R']).to_numpy()
             
             label = f'{size} ({prog.replace("find", "")})'
             marker = 'o' if prog == 'findsp' else 's'
@@ -115,30 +129,22 @@ ax.legend()
 ax.grid(True, alpha=0.3)
 
 plt.tight_layout()
-plt.savefig('experiment_results/plots/performance_comparison.png', dpi=150)
-plt.show()
+fig.savefig('experiment_results/plots/performance_comparison.png', dpi=150)
+if interactive:
+    plt.show()
+plt.close(fig)
 
 # Generate summary statistics
 print("\n=== Performance Summary ===\n")
 print("Average Execution Times by Program Type:")
-print(df.groupby('Program')['Time'].agg(['mean', 'std', 'min', 'max']))
+print(df.groupby('Program', observed=True)['Time'].agg(['mean', 'std', 'min', 'max']))
 
 print("\n\nAverage Times by Input Size and Program:")
 pivot_table = df.pivot_table(values='Time', index='Input_Size', 
-                             columns='Program', aggfunc='mean')
-pivot_table = pivot_table.reindex(available_sizes)
+                             columns='Program', aggfunc='mean', observed=True)
 print(pivot_table)
 
 print("\n\nBest Configurations by Input Size:")
-for size in available_sizes:
-    size_data = df[df['Input_Size'] == size]
-    best_sp = size_data[size_data['Program'] == 'findsp'].nsmallest(1, 'Time')
-    best_st = size_data[size_data['Program'] == 'findst'].nsmallest(1, 'Time')
-    
-    print(f"\n{size.upper()}:")
-    if not best_sp.empty:
-        print(f"  Best findsp: M={best_sp.iloc[0]['M']}, R={best_sp.iloc[0]['R']}, "
-              f"Time={best_sp.iloc[0]['Time']:.3f}s")
-    if not best_st.empty:
-        print(f"  Best findst: M={best_st.iloc[0]['M']}, R={best_st.iloc[0]['R']}, "
-              f"Time={best_st.iloc[0]['Time']:.3f}s")
\ No newline at end of file
+best_idx = df.groupby(['Input_Size', 'Program'], observed=True)['Time'].idxmin()
+best = df.loc[best_idx, ['Input_Size', 'Program', 'M', 'R', 'Time']]
+print(best.to_string(index=False, float_format='%.3f'))
\ No newline at end of file
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+
+import os
+import pickle
+
+def load_cached(results_file, parse):
+    """
+    Return parse(results_file), memoized in a pickle next to the CSV.
+    The cache is reused only while it is newer than both the CSV and the
+    script defining parse, so new results or analyzer edits invalidate it.
+    Pickle protocol 4 keeps the cache readable from both CPython and PyPy.
+    """
+    cache_file = os.path.splitext(results_file)[0] + '.pickle'
+    source_mtime = max(os.stat(results_file).st_mtime_ns,
+                       os.stat(parse.__code__.co_filename).st_mtime_ns)
+    if os.path.exists(cache_file) and os.stat(cache_file).st_mtime_ns >= source_mtime:
+        try:
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+        except (pickle.UnpicklingError, ValueError, EOFError):
+            pass  # Unreadable by this interpreter; rebuild it below
+
+    result = parse(results_file)
+    with open(cache_file, 'wb') as f:
+        pickle.dump(result, f, protocol=4)
+    return result
\ No newline at end of file
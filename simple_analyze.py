@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
+# Standard library only, so this also runs under PyPy: pypy3 simple_analyze.py
 
 import csv
 import os
 from collections import defaultdict
+from operator import itemgetter
+
+from results_cache import load_cached
 
 # Read the results
 results_file = "experiment_results/results.csv"
@@ -11,16 +15,55 @@ if not os.path.exists(results_file):
     print(f"Results file {results_file} not found. Run run_experiments.sh first.")
     exit(1)
 
-# Parse CSV data
-data = []
-with open(results_file, 'r') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        row['Time'] = float(row['Time'])
-        row['M'] = int(row['M'])
-        row['R'] = int(row['R'])
-        row['Edges'] = int(row['Edges'])
-        data.append(row)
+SIZES = ['tiny', 'small', 'medium', 'large']
+# Columns kept from each row, in the order rows are unpacked below
+COLUMNS = ['Input_Size', 'Edges', 'M', 'R', 'Program', 'Time']
+COLUMN_TYPES = {'Edges': int, 'M': int, 'R': int, 'Time': float}
+# Slot of the running [sum, count] pair for each program in a [sp_sum, sp_cnt, st_sum, st_cnt] accumulator
+PROGRAM_SLOT = {'findsp': 0, 'findst': 2}
+
+def new_sums():
+    """
+    Return an empty [sp_sum, sp_cnt, st_sum, st_cnt] accumulator.
+    """
+    return [0, 0, 0, 0]
+
+def add_time(sums, prog, t):
+    """
+    Add one row's time to its program's running sum and count.
+    """
+    slot = PROGRAM_SLOT[prog]
+    sums[slot] += t
+    sums[slot + 1] += 1
+
+def parse_results(path):
+    """
+    Parse the results CSV into plain tuples in COLUMNS order, so loops unpack
+    fields into locals instead of hashing a column name on every access.
+    Values are cast a whole column at a time with map(), not field by field.
+    """
+    with open(path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        raw = list(zip(*reader)) or [()] * len(header)
+    return list(zip(*(map(COLUMN_TYPES.get(name, str), raw[header.index(name)])
+                      for name in COLUMNS)))
+
+# Repeat runs on an unchanged CSV reuse the parsed rows from disk
+data = load_cached(results_file, parse_results)
+
+# Build every view the sections need in one pass, so no section rescans data
+groups = defaultdict(list)
+by_size = defaultdict(list)
+edges_by_size = {}
+size_sums = defaultdict(new_sums)
+program_sums = new_sums()
+for size, edges, m, r, prog, t in data:
+    groups[(size, prog)].append((m, r, t))
+    by_size[size].append((m, r, prog, t))
+    edges_by_size.setdefault(size, edges)
+    add_time(size_sums[size], prog, t)
+    add_time(program_sums, prog, t)
 
 print("=" * 70)
 print("PERFORMANCE EXPERIMENT RESULTS ANALYSIS")
@@ -30,28 +73,24 @@ print("=" * 70)
 print("\n1. OVERALL COMPARISON: Multi-Process (findsp) vs Multi-Threaded (findst)")
 print("-" * 60)
 
-process_times = [d['Time'] for d in data if d['Program'] == 'findsp']
-thread_times = [d['Time'] for d in data if d['Program'] == 'findst']
-
 print(f"Average execution time:")
-print(f"  - findsp (processes): {sum(process_times)/len(process_times):.4f} seconds")
-print(f"  - findst (threads):   {sum(thread_times)/len(thread_times):.4f} seconds")
+print(f"  - findsp (processes): {program_sums[0]/program_sums[1]:.4f} seconds")
+print(f"  - findst (threads):   {program_sums[2]/program_sums[3]:.4f} seconds")
 
 # 2. Performance by input size
 print("\n2. PERFORMANCE BY INPUT SIZE (average times in seconds)")
 print("-" * 60)
 
-size_stats = defaultdict(lambda: {'findsp': [], 'findst': []})
-for d in data:
-    size_stats[d['Input_Size']][d['Program']].append(d['Time'])
-
 print(f"{'Size':<10} {'Edges':<10} {'findsp (avg)':<15} {'findst (avg)':<15} {'Difference':<10}")
 print("-" * 65)
-for size in ['tiny', 'small', 'medium', 'large']:
-    if size in size_stats:
-        edges = next((d['Edges'] for d in data if d['Input_Size'] == size), 0)
-        sp_avg = sum(size_stats[size]['findsp']) / len(size_stats[size]['findsp'])
-        st_avg = sum(size_stats[size]['findst']) / len(size_stats[size]['findst'])
+for size in SIZES:
+    sp_data = groups.get((size, 'findsp'))
+    st_data = groups.get((size, 'findst'))
+    if sp_data and st_data:
+        edges = edges_by_size[size]
+        sums = size_sums[size]
+        sp_avg = sums[0] / sums[1]
+        st_avg = sums[2] / sums[3]
         diff = ((st_avg - sp_avg) / sp_avg * 100) if sp_avg > 0 else 0
         print(f"{size:<10} {edges:<10} {sp_avg:<15.4f} {st_avg:<15.4f} {diff:+.1f}%")
 
@@ -59,35 +98,37 @@ for size in ['tiny', 'small', 'medium', 'large']:
 print("\n3. BEST CONFIGURATIONS BY INPUT SIZE")
 print("-" * 60)
 
-for size in ['tiny', 'small', 'medium', 'large']:
-    size_data = [d for d in data if d['Input_Size'] == size]
-    if size_data:
-        best_sp = min([d for d in size_data if d['Program'] == 'findsp'], key=lambda x: x['Time'])
-        best_st = min([d for d in size_data if d['Program'] == 'findst'], key=lambda x: x['Time'])
+for size in SIZES:
+    sp_data = groups.get((size, 'findsp'))
+    st_data = groups.get((size, 'findst'))
+    if sp_data and st_data:
+        sp_m, sp_r, sp_t = min(sp_data, key=itemgetter(2))
+        st_m, st_r, st_t = min(st_data, key=itemgetter(2))
         
-        print(f"\n{size.upper()} ({best_sp['Edges']} edges):")
-        print(f"  Best findsp: M={best_sp['M']}, R={best_sp['R']}, Time={best_sp['Time']:.4f}s")
-        print(f"  Best findst: M={best_st['M']}, R={best_st['R']}, Time={best_st['Time']:.4f}s")
+        print(f"\n{size.upper()} ({edges_by_size[size]} edges):")
+        print(f"  Best findsp: M={sp_m}, R={sp_r}, Time={sp_t:.4f}s")
+        print(f"  Best findst: M={st_m}, R={st_r}, Time={st_t:.4f}s")
 
 # 4. Effect of varying M (mappers)
 print("\n4. EFFECT OF NUMBER OF MAPPERS (M) - Fixed R=4, medium dataset")
 print("-" * 60)
 
-medium_r4 = [d for d in data if d['Input_Size'] == 'medium' and d['R'] == 4]
-m_stats = defaultdict(lambda: {'findsp': [], 'findst': []})
-for d in medium_r4:
-    m_stats[d['M']][d['Program']].append(d['Time'])
+m_stats = defaultdict(new_sums)
+for m, r, prog, t in by_size['medium']:
+    if r == 4:
+        add_time(m_stats[m], prog, t)
 
 print(f"{'M':<5} {'findsp (avg)':<15} {'findst (avg)':<15} {'Speedup (sp)':<15} {'Speedup (st)':<15}")
 print("-" * 65)
 
 # Get baseline (M=1)
-baseline_sp = sum(m_stats[1]['findsp']) / len(m_stats[1]['findsp']) if 1 in m_stats else 1
-baseline_st = sum(m_stats[1]['findst']) / len(m_stats[1]['findst']) if 1 in m_stats else 1
+baseline_sp = m_stats[1][0] / m_stats[1][1] if 1 in m_stats else 1
+baseline_st = m_stats[1][2] / m_stats[1][3] if 1 in m_stats else 1
 
 for m in sorted(m_stats.keys()):
-    sp_avg = sum(m_stats[m]['findsp']) / len(m_stats[m]['findsp'])
-    st_avg = sum(m_stats[m]['findst']) / len(m_stats[m]['findst'])
+    sums = m_stats[m]
+    sp_avg = sums[0] / sums[1]
+    st_avg = sums[2] / sums[3]
     sp_speedup = baseline_sp / sp_avg if sp_avg > 0 else 0
     st_speedup = baseline_st / st_avg if st_avg > 0 else 0
     print(f"{m:<5} {sp_avg:<15.4f} {st_avg:<15.4f} {sp_speedup:<15.2f} {st_speedup:<15.2f}")
@@ -96,21 +137,22 @@ for m in sorted(m_stats.keys()):
 print("\n5. EFFECT OF NUMBER OF REDUCERS (R) - Fixed M=4, medium dataset")
 print("-" * 60)
 
-medium_m4 = [d for d in data if d['Input_Size'] == 'medium' and d['M'] == 4]
-r_stats = defaultdict(lambda: {'findsp': [], 'findst': []})
-for d in medium_m4:
-    r_stats[d['R']][d['Program']].append(d['Time'])
+r_stats = defaultdict(new_sums)
+for m, r, prog, t in by_size['medium']:
+    if m == 4:
+        add_time(r_stats[r], prog, t)
 
 print(f"{'R':<5} {'findsp (avg)':<15} {'findst (avg)':<15} {'Speedup (sp)':<15} {'Speedup (st)':<15}")
 print("-" * 65)
 
 # Get baseline (R=1)
-baseline_sp = sum(r_stats[1]['findsp']) / len(r_stats[1]['findsp']) if 1 in r_stats else 1
-baseline_st = sum(r_stats[1]['findst']) / len(r_stats[1]['findst']) if 1 in r_stats else 1
+baseline_sp = r_stats[1][0] / r_stats[1][1] if 1 in r_stats else 1
+baseline_st = r_stats[1][2] / r_stats[1][3] if 1 in r_stats else 1
 
 for r in sorted(r_stats.keys()):
-    sp_avg = sum(r_stats[r]['findsp']) / len(r_stats[r]['findsp'])
-    st_avg = sum(r_stats[r]['findst']) / len(r_stats[r]['findst'])
+    sums = r_stats[r]
+    sp_avg = sums[0] / sums[1]
+    st_avg = sums[2] / sums[3]
     sp_speedup = baseline_sp / sp_avg if sp_avg > 0 else 0
     st_speedup = baseline_st / st_avg if st_avg > 0 else 0
     print(f"{r:<5} {sp_avg:<15.4f} {st_avg:<15.4f} {sp_speedup:<15.2f} {st_speedup:<15.2f}")
@@ -119,26 +161,23 @@ for r in sorted(r_stats.keys()):
 print("\n6. SCALABILITY ANALYSIS - Large dataset (100000 edges)")
 print("-" * 60)
 
-large_data = [d for d in data if d['Input_Size'] == 'large']
-worker_stats = defaultdict(lambda: {'findsp': [], 'findst': []})
-for d in large_data:
-    total_workers = d['M'] + d['R']
-    worker_stats[total_workers][d['Program']].append(d['Time'])
+worker_stats = defaultdict(new_sums)
+for m, r, prog, t in by_size['large']:
+    add_time(worker_stats[m + r], prog, t)
 
 print(f"{'Workers':<10} {'findsp (avg)':<15} {'findst (avg)':<15} {'Efficiency (sp)':<18} {'Efficiency (st)':<18}")
 print("-" * 76)
 
 # Get baseline (2 workers - M=1, R=1)
-baseline_data = [d for d in large_data if d['M'] == 1 and d['R'] == 1]
-baseline_sp = sum([d['Time'] for d in baseline_data if d['Program'] == 'findsp']) / len([d for d in baseline_data if d['Program'] == 'findsp'])
-baseline_st = sum([d['Time'] for d in baseline_data if d['Program'] == 'findst']) / len([d for d in baseline_data if d['Program'] == 'findst'])
+baseline = worker_stats[2]
+baseline_sp = baseline[0] / baseline[1]
+baseline_st = baseline[2] / baseline[3]
 
 for workers in sorted(worker_stats.keys()):
-    sp_times = worker_stats[workers]['findsp']
-    st_times = worker_stats[workers]['findst']
-    if sp_times and st_times:
-        sp_avg = sum(sp_times) / len(sp_times)
-        st_avg = sum(st_times) / len(st_times)
+    sums = worker_stats[workers]
+    if sums[1] and sums[3]:
+        sp_avg = sums[0] / sums[1]
+        st_avg = sums[2] / sums[3]
         sp_speedup = baseline_sp / sp_avg if sp_avg > 0 else 0
         st_speedup = baseline_st / st_avg if st_avg > 0 else 0
         sp_efficiency = (sp_speedup / workers * 100) if workers > 0 else 0